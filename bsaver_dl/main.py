@@ -19,41 +19,33 @@ License: MIT
 Repository: https://github.com/cristiangauma/bsaver-dl
 """
 
+from __future__ import annotations
+
 import argparse
-import base64
+import binascii
 import json
 import logging
+import os
 import re
 import shutil
 import sys
-import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.parse import quote_plus
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
-# Third-party dependencies
-try:
+# Third-party dependencies; rich and urllib3 are imported lazily so that
+# --help and --version do not pay their import cost
+if TYPE_CHECKING:
+    import urllib3
     from rich.console import Console
-    from rich.logging import RichHandler
-    from rich.panel import Panel
-    from rich.progress import (
-        BarColumn,
-        Progress,
-        TextColumn,
-        TimeElapsedColumn,
-        TimeRemainingColumn,
-    )
     from rich.table import Table
-    from rich.text import Text
+
+# Optional dependencies
+try:
+    import orjson
 except ImportError:
-    print(
-        "This script requires the 'rich' library for enhanced UI.\n"
-        "Install it with: pip install rich",
-        file=sys.stderr
-    )
-    sys.exit(1)
+    orjson = None
 
 # Import version from package
 try:
@@ -70,9 +62,97 @@ USER_AGENT = (
 )
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
+MAX_CONCURRENT_DOWNLOADS = 8
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+REQUEST_TIMEOUT = 30.0
+PROBE_TIMEOUT = 10.0
+WARM_UP_TIMEOUT = 5.0
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Characters that are illegal in filenames on Windows/Unix filesystems:
+# < > : " / \ | ? * and control characters (0x00-0x1F)
+_ILLEGAL_FILENAME_CHARS = '<>:"/\\|?*' + ''.join(chr(c) for c in range(0x20))
+_ILLEGAL_FILENAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+_ILLEGAL_FILENAME_TABLE = str.maketrans(dict.fromkeys(_ILLEGAL_FILENAME_CHARS, "_"))
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# BeatSaver song hashes are lowercase hex SHA-1 digests
+_SONG_HASH_RE = re.compile(r'[0-9a-f]{40}')
+
+# Pre-rendered markup for the song status column
+STATUS_PRESENT = "[green]✅ Present[/green]"
+STATUS_MISSING = "[yellow]⬇️ Missing[/yellow]"
+STATUS_NO_HASH = "[red]❌ No Hash[/red]"
+STATUS_INVALID_HASH = "[red]❌ Invalid Hash[/red]"
+
+# A playlist song as (lowercase hash, display name, original song dict)
+SongEntry = Tuple[str, str, Dict]
+
+# Global console instance, created on first use by get_console()
+_console = None
+
+# Set when a download run is interrupted so worker threads abandon the
+# downloads they are streaming instead of finishing them
+_cancel_downloads = threading.Event()
+
+# Responses currently being streamed, so a cancelled run can interrupt
+# reads that are blocked on a slow connection
+_active_responses = set()
+_active_responses_lock = threading.Lock()
+
+# Shared connection pool, created on first use by get_http()
+_http = None
+_http_lock = threading.Lock()
+
+
+def get_console() -> Console:
+    """Return the shared Rich console, creating it on first use.
+    
+    Rich is only imported here so that code paths which never print
+    (argument parsing, --help, --version) start without loading it.
+    
+    Returns:
+        Console: The global console instance.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
-# Global console instance
-console = Console()
+
+def get_http(maxsize: int = MAX_CONCURRENT_DOWNLOADS) -> urllib3.PoolManager:
+    """Return the shared HTTP connection pool, creating it on first use.
+    
+    Every download to the CDN goes through this pool, so requests reuse
+    keep-alive sockets instead of paying a new TCP+TLS handshake per song.
+    No Accept-Encoding is advertised: song archives are already
+    compressed, so asking for an outer gzip layer only costs CPU on both
+    ends. urllib3 is only imported here, like rich in get_console().
+    
+    Args:
+        maxsize (int): Connections kept open per host, which should match
+            the number of download workers. Only used when the pool is
+            created; later calls return the existing pool.
+    
+    Returns:
+        urllib3.PoolManager: The global connection pool.
+    """
+    global _http
+    # Worker threads may ask for the pool at the same time
+    with _http_lock:
+        if _http is None:
+            import urllib3
+            _http = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=maxsize,
+                headers={
+                    'User-Agent': USER_AGENT,
+                    'Accept': '*/*',
+                },
+                timeout=REQUEST_TIMEOUT,
+            )
+    return _http
 
 
 class PlaylistDownloaderError(Exception):
@@ -103,6 +183,19 @@ class PlaylistParseError(PlaylistDownloaderError):
     pass
 
 
+class DownloadCancelledError(PlaylistDownloaderError):
+    """Exception raised inside a worker when its download run is cancelled.
+    
+    Used to unwind a download that is streaming when the user interrupts
+    the run, so the partial file is removed and the worker stops early.
+    It never escapes download_file_with_retry().
+    
+    Attributes:
+        Inherits all attributes from PlaylistDownloaderError.
+    """
+    pass
+
+
 class DownloadError(PlaylistDownloaderError):
     """Exception raised when download operations fail permanently.
     
@@ -134,12 +227,14 @@ def setup_logging(verbose: bool = False) -> None:
         This function configures the global logging system and should
         be called once at the start of the application.
     """
+    from rich.logging import RichHandler
+    
     log_level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=log_level,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)]
+        handlers=[RichHandler(console=get_console(), rich_tracebacks=True)]
     )
 
 
@@ -168,12 +263,15 @@ def safe_filename(name: str, replace_with: str = "_", max_length: int = 200) ->
     if not name:
         return "untitled"
     
-    # Remove/replace illegal characters for Windows/Unix filesystems
-    # < > : " / \ | ? * and control characters (0x00-0x1F)
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1F]', replace_with, name)
+    # Remove/replace illegal characters for Windows/Unix filesystems;
+    # the default replacement uses a precomputed translation table
+    if replace_with == "_":
+        sanitized = name.translate(_ILLEGAL_FILENAME_TABLE)
+    else:
+        sanitized = _ILLEGAL_FILENAME_RE.sub(replace_with, name)
     
     # Normalize whitespace
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+    sanitized = _WHITESPACE_RE.sub(' ', sanitized).strip()
     
     # Remove leading/trailing dots and spaces (Windows compatibility)
     sanitized = sanitized.strip('. ')
@@ -194,82 +292,229 @@ def safe_filename(name: str, replace_with: str = "_", max_length: int = 200) ->
     return sanitized
 
 
+def load_cache_validators(dest: Path) -> Dict[str, str]:
+    """Build conditional request headers for a previously downloaded file.
+    
+    Reads the ETag and Last-Modified values stored in the sidecar file
+    next to a download (``<name>.etag``) and turns them into
+    If-None-Match / If-Modified-Since headers. Validators are only used
+    while the downloaded file itself still exists and is not empty, since
+    a 304 response carries no body to recreate it from.
+    
+    Args:
+        dest (Path): Path of the downloaded file.
+        
+    Returns:
+        Dict[str, str]: Conditional request headers, empty if there is no
+            usable sidecar.
+    """
+    sidecar = dest.with_name(dest.name + ".etag")
+    try:
+        if dest.stat().st_size == 0 or not sidecar.exists():
+            return {}
+    except OSError:
+        return {}
+    
+    try:
+        validators = json.loads(sidecar.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def save_cache_validators(dest: Path, response_headers) -> None:
+    """Store the ETag and Last-Modified of a completed download.
+    
+    Writes the validators to a ``<name>.etag`` sidecar next to the
+    downloaded file so later runs can issue conditional requests. Any
+    stale sidecar is removed when the server sent no validators.
+    
+    Args:
+        dest (Path): Path of the downloaded file.
+        response_headers: Headers of the response the file was written from.
+    """
+    sidecar = dest.with_name(dest.name + ".etag")
+    validators = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    
+    try:
+        if any(validators.values()):
+            sidecar.write_text(json.dumps(validators), encoding="utf-8")
+        elif sidecar.exists():
+            sidecar.unlink()
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Could not update {sidecar}: {e}")
+
+
 def download_file_with_retry(
     url: str, 
     dest: Path, 
     max_retries: int = MAX_RETRIES,
-    retry_delay: float = RETRY_DELAY
+    retry_delay: float = RETRY_DELAY,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    revalidate: bool = True
 ) -> bool:
     """
     Download a file from URL to destination with retry logic and proper error handling.
     
-    This function implements exponential backoff retry logic and comprehensive
-    error handling for network requests. It uses a browser-like User-Agent
-    to avoid 403 responses from some servers.
+    Requests go through the shared HTTP connection pool, so consecutive
+    downloads reuse open connections to the CDN. Retries with exponential
+    backoff are delegated to urllib3 for connection errors and transient
+    server errors (5xx); a connection that breaks or times out while the
+    body is streaming restarts the download with the same backoff. A
+    browser-like User-Agent is sent to avoid 403 responses from some
+    servers.
+    
+    The body is written to a ``.part`` file next to the destination and
+    renamed into place once complete, so the destination is either the
+    previous file or the full new download, never a partial one.
+    
+    If the file was downloaded before and revalidate is set, the request
+    is made conditional on the stored ETag/Last-Modified values and a
+    304 Not Modified response keeps the existing file without
+    transferring it again.
     
     Args:
         url: The URL to download from
         dest: Path object representing the destination file
         max_retries: Maximum number of retry attempts
         retry_delay: Base delay between retries (seconds)
+        progress_callback: Optional function called with the number of
+            bytes written after every chunk, and with the negated total of
+            an attempt that is discarded before a retry
+        revalidate: Whether to send the stored validators of an existing
+            file; when False the file is always transferred again
         
     Returns:
         True if download successful, False otherwise
-        
-    Raises:
-        DownloadError: If all retry attempts fail with non-recoverable error
     """
+    import urllib3
+    
     logger = logging.getLogger(__name__)
+    http = get_http()
     
+    # Revalidate an existing copy instead of transferring it again
+    headers = dict(http.headers)
+    if revalidate:
+        headers.update(load_cache_validators(dest))
+    
+    # urllib3 retries failures up to the response headers; a connection
+    # that drops while the body is streaming is retried here instead
     for attempt in range(max_retries + 1):
+        if _cancel_downloads.is_set():
+            return False
+        
+        retries = urllib3.Retry(
+            total=max_retries,
+            backoff_factor=retry_delay,
+            status_forcelist=RETRY_STATUS_CODES,
+        )
+        
         try:
-            # Create request with browser-like headers
-            request = Request(
+            response = http.request(
+                "GET",
                 url,
-                headers={
-                    'User-Agent': USER_AGENT,
-                    'Accept': '*/*',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
-                }
+                headers=headers,
+                retries=retries,
+                preload_content=False,
+                decode_content=True,
             )
+        except urllib3.exceptions.HTTPError as e:
+            logger.warning(f"Network error downloading {url}: {e}")
+            return False
+        
+        with _active_responses_lock:
+            _active_responses.add(response)
+        
+        written = 0
+        try:
+            if response.status == 304:
+                logger.debug(f"Not modified, keeping existing {dest}")
+                return True
             
-            # Perform download
-            with urlopen(request, timeout=30) as response:
-                if response.status != 200:
-                    logger.warning(f"HTTP {response.status} for {url}")
-                    if response.status in (404, 410):  # Not found, gone
-                        return False
-                    if attempt < max_retries:
-                        continue
-                    return False
-                
-                # Ensure destination directory exists
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Download with progress tracking
-                with open(dest, "wb") as f:
-                    shutil.copyfileobj(response, f)
+            if response.status != 200:
+                logger.warning(f"HTTP {response.status} for {url}")
+                return False
+            
+            # Ensure destination directory exists
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Stream the body in large chunks into a temporary file, then
+            # publish it atomically so an interrupted download never leaves
+            # a truncated archive that looks complete
+            content_length = response.headers.get("Content-Length")
+            tmp_path = dest.with_name(dest.name + ".part")
+            try:
+                with open(tmp_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                    for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+                        if _cancel_downloads.is_set():
+                            raise DownloadCancelledError(url)
+                        f.write(chunk)
+                        written += len(chunk)
+                        if progress_callback is not None:
+                            progress_callback(len(chunk))
                 
-                logger.debug(f"Successfully downloaded {url} to {dest}")
-                return True
+                # Older urllib3 versions do not detect a short body
+                if (content_length and content_length.isdigit()
+                        and not response.headers.get("Content-Encoding")
+                        and written != int(content_length)):
+                    raise urllib3.exceptions.ProtocolError(
+                        f"Connection broken: received {written} of {content_length} bytes"
+                    )
                 
-        except (HTTPError, URLError) as e:
+                os.replace(tmp_path, dest)
+            except BaseException:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
+            
+            save_cache_validators(dest, response.headers)
+            
+            logger.debug(f"Successfully downloaded {url} to {dest}")
+            return True
+        
+        except (urllib3.exceptions.ProtocolError, urllib3.exceptions.ReadTimeoutError) as e:
+            if _cancel_downloads.is_set():
+                # The read was interrupted by cancel_active_downloads()
+                logger.debug(f"Download cancelled: {url}")
+                return False
+            logger.warning(f"Network error downloading {url}: {e}")
+            if attempt >= max_retries:
+                return False
+            
+            # Take back the progress of the lost attempt
+            if progress_callback is not None and written:
+                progress_callback(-written)
+            
+            delay = retry_delay * (2 ** attempt)  # Exponential backoff
+            logger.debug(f"Retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})")
+            if _cancel_downloads.wait(delay):
+                return False
+        
+        except DownloadCancelledError:
+            logger.debug(f"Download cancelled: {url}")
+            return False
+            
+        except urllib3.exceptions.HTTPError as e:
             logger.warning(f"Network error downloading {url}: {e}")
-            if attempt < max_retries:
-                delay = retry_delay * (2 ** attempt)  # Exponential backoff
-                logger.debug(f"Retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(delay)
-                continue
             return False
             
         except Exception as e:
             logger.error(f"Unexpected error downloading {url}: {e}")
-            if attempt < max_retries:
-                delay = retry_delay * (2 ** attempt)
-                time.sleep(delay)
-                continue
             return False
+            
+        finally:
+            with _active_responses_lock:
+                _active_responses.discard(response)
+            response.release_conn()
     
     return False
 
@@ -279,7 +524,8 @@ def parse_playlist_file(playlist_path: Path) -> Dict:
     
     Reads and validates a BeatSaver playlist file, ensuring it contains
     valid JSON and has the expected structure. Creates an empty songs
-    list if none exists.
+    list if none exists. Uses orjson for parsing when it is installed,
+    falling back to the standard library json module otherwise.
     
     Args:
         playlist_path (Path): Path to the .bplist file to parse.
@@ -305,9 +551,12 @@ def parse_playlist_file(playlist_path: Path) -> Dict:
         if not playlist_path.is_file():
             raise PlaylistParseError(f"Path is not a file: {playlist_path}")
         
-        # Read and parse JSON
-        content = playlist_path.read_text(encoding="utf-8")
-        data = json.loads(content)
+        # Read and parse JSON; orjson parses the raw UTF-8 bytes directly
+        if orjson is not None:
+            data = orjson.loads(playlist_path.read_bytes())
+        else:
+            content = playlist_path.read_text(encoding="utf-8")
+            data = json.loads(content)
         
         # Validate required fields
         if not isinstance(data, dict):
@@ -331,8 +580,9 @@ def extract_and_save_cover_image(playlist_data: Dict, dest_dir: Path) -> Optiona
     """Extract and save the playlist cover image from base64 data.
     
     Decodes base64 image data from the playlist and saves it as a cover
-    image file. Automatically detects image format (JPEG, PNG, GIF) based
-    on file headers and uses appropriate file extension.
+    image file. Data URI prefixes such as "data:image/png;base64," are
+    stripped before decoding. Automatically detects image format (JPEG,
+    PNG, GIF) based on file headers and uses appropriate file extension.
     
     Args:
         playlist_data (Dict): Parsed playlist dictionary containing image data.
@@ -347,7 +597,9 @@ def extract_and_save_cover_image(playlist_data: Dict, dest_dir: Path) -> Optiona
     Note:
         Supported image formats are JPEG, PNG, and GIF. If format cannot
         be determined, defaults to JPEG extension. Failed extractions are
-        logged as warnings but don't raise exceptions.
+        logged as warnings but don't raise exceptions. The 'image' key is
+        removed from playlist_data so the encoded image is not kept alive
+        for the rest of the run.
         
     Example:
         >>> cover_path = extract_and_save_cover_image(playlist_data, Path("./output"))
@@ -356,14 +608,20 @@ def extract_and_save_cover_image(playlist_data: Dict, dest_dir: Path) -> Optiona
     """
     logger = logging.getLogger(__name__)
     
-    img_data = playlist_data.get("image", "")
+    # Take the (potentially large) base64 string out of the playlist so it
+    # can be freed as soon as it has been decoded
+    img_data = playlist_data.pop("image", "")
     if not img_data:
         logger.debug("No cover image data found in playlist")
         return None
     
     try:
-        # Decode base64 image data
-        img_bytes = base64.b64decode(img_data)
+        # Decode base64 image data, dropping a data URI prefix if present
+        raw = img_data.encode("ascii", "ignore") if isinstance(img_data, str) else img_data
+        if raw.startswith(b"data:"):
+            raw = raw.partition(b",")[2]
+        img_bytes = binascii.a2b_base64(raw)
+        del img_data, raw
         
         # Determine file extension based on image header
         if img_bytes.startswith(b'\xFF\xD8\xFF'):
@@ -377,7 +635,9 @@ def extract_and_save_cover_image(playlist_data: Dict, dest_dir: Path) -> Optiona
         
         # Save image
         img_path = dest_dir / f"cover.{ext}"
-        img_path.write_bytes(img_bytes)
+        with img_path.open("wb", buffering=0) as f:
+            f.write(img_bytes)
+        del img_bytes
         
         logger.info(f"Saved cover image to {img_path}")
         return img_path
@@ -387,7 +647,100 @@ def extract_and_save_cover_image(playlist_data: Dict, dest_dir: Path) -> Optiona
         return None
 
 
-def create_song_status_table(songs: List[Dict], dest_dir: Path) -> Tuple[Table, List[Dict]]:
+def scan_existing_downloads(dest_dir: Path) -> Dict[str, int]:
+    """Collect the sizes of all song archives already in a directory.
+    
+    Reads the destination directory once with os.scandir instead of
+    stat-ing a path per song, so checking a large playlist costs a single
+    directory listing.
+    
+    Args:
+        dest_dir (Path): Directory where songs are stored.
+        
+    Returns:
+        Dict[str, int]: Mapping of archive name without the .zip suffix
+            (normally the lowercase song hash) to its size in bytes. Empty
+            if the directory does not exist.
+    """
+    existing = {}
+    
+    try:
+        with os.scandir(dest_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".zip"):
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                existing[entry.name[:-4]] = size
+    except FileNotFoundError:
+        pass
+    
+    return existing
+
+
+def normalize_songs(songs: List[Dict]) -> List[SongEntry]:
+    """Extract the fields the downloader needs from each playlist song.
+    
+    Looks up and lowercases each song's hash and resolves its display
+    name once, so the status and download phases can unpack tuples
+    instead of repeating the dictionary lookups.
+    
+    Args:
+        songs (List[Dict]): List of song dictionaries from the playlist.
+            Each song should have 'hash' and 'songName' keys.
+        
+    Returns:
+        List[SongEntry]: One (hash, name, song) tuple per song, in playlist
+            order. Songs without a hash get an empty string.
+    """
+    return [
+        (song.get("hash", "").lower(), song.get("songName", "Unknown"), song)
+        for song in songs
+    ]
+
+
+def iter_song_status(
+    songs: List[SongEntry],
+    dest_dir: Path
+) -> Iterator[Tuple[int, SongEntry, str]]:
+    """Determine the download status of each song in a playlist.
+    
+    Separates the status analysis from table rendering so callers can
+    consume results row by row. The destination directory is scanned
+    once up front, after which each song is a constant-time lookup.
+    
+    Args:
+        songs (List[SongEntry]): Songs as returned by normalize_songs().
+        dest_dir (Path): Directory where songs should be stored.
+        
+    Yields:
+        Tuple[int, SongEntry, str]: For each song, its 1-based index, its
+            entry and one of STATUS_PRESENT, STATUS_MISSING, STATUS_NO_HASH
+            or STATUS_INVALID_HASH.
+    """
+    existing = scan_existing_downloads(dest_dir)
+    
+    for idx, entry in enumerate(songs, 1):
+        song_hash = entry[0]
+        
+        if not song_hash:
+            status = STATUS_NO_HASH
+        elif not _SONG_HASH_RE.fullmatch(song_hash):
+            status = STATUS_INVALID_HASH
+        elif existing.get(song_hash, 0) > 0:
+            status = STATUS_PRESENT
+        else:
+            status = STATUS_MISSING
+        
+        yield idx, entry, status
+
+
+def create_song_status_table(
+    songs: List[SongEntry],
+    dest_dir: Path
+) -> Tuple[Table, List[SongEntry]]:
     """Create a rich table showing song download status and identify missing songs.
     
     Analyzes each song in the playlist to determine its download status
@@ -395,26 +748,28 @@ def create_song_status_table(songs: List[Dict], dest_dir: Path) -> Tuple[Table,
     a formatted table for display and returns a list of missing songs.
     
     Args:
-        songs (List[Dict]): List of song dictionaries from the playlist.
-            Each song should have 'hash' and 'songName' keys.
+        songs (List[SongEntry]): Songs as returned by normalize_songs().
         dest_dir (Path): Directory where songs should be stored.
             Used to check for existing downloaded files.
         
     Returns:
-        Tuple[Table, List[Dict]]: A tuple containing:
+        Tuple[Table, List[SongEntry]]: A tuple containing:
             - Table: Rich table object ready for console display
-            - List[Dict]: List of songs that need to be downloaded
+            - List[SongEntry]: List of songs that need to be downloaded
             
     Note:
         Songs are considered present if a .zip file with the correct hash
-        exists and has non-zero size. Songs without hashes are marked
-        as having no hash and are not included in the missing list.
+        exists and has non-zero size. Songs without a hash, or with one that
+        is not a 40-character hex digest, are marked as such and are not
+        included in the missing list.
         
     Example:
         >>> table, missing = create_song_status_table(songs, Path("./downloads"))
         >>> console.print(table)
         >>> print(f"Need to download {len(missing)} songs")
     """
+    from rich.table import Table
+    
     table = Table(title="Song Download Status", show_lines=False)
     table.add_column("#", justify="right", style="dim")
     table.add_column("Song Name", overflow="fold")
@@ -423,19 +778,10 @@ def create_song_status_table(songs: List[Dict], dest_dir: Path) -> Tuple[Table,
     
     missing_songs = []
     
-    for idx, song in enumerate(songs, 1):
-        song_hash = song.get("hash", "").lower()
-        song_name = song.get("songName", "Unknown")
-        
-        if not song_hash:
-            status_text = Text("❌ No Hash", style="red")
-        else:
-            zip_path = dest_dir / f"{song_hash}.zip"
-            if zip_path.exists() and zip_path.stat().st_size > 0:
-                status_text = Text("✅ Present", style="green")
-            else:
-                status_text = Text("⬇️ Missing", style="yellow")
-                missing_songs.append(song)
+    for idx, entry, status_text in iter_song_status(songs, dest_dir):
+        song_hash, song_name, _ = entry
+        if status_text == STATUS_MISSING:
+            missing_songs.append(entry)
         
         table.add_row(
             str(idx),
@@ -447,18 +793,106 @@ def create_song_status_table(songs: List[Dict], dest_dir: Path) -> Tuple[Table,
     return table, missing_songs
 
 
-def download_missing_songs(missing_songs: List[Dict], dest_dir: Path) -> Tuple[int, int]:
+def warm_up_connection() -> None:
+    """Open a pooled connection to the CDN ahead of the first download.
+    
+    Sends a throwaway HEAD request to the CDN root so that DNS lookup and
+    the TCP+TLS handshake happen while the UI is still being set up. The
+    connection is returned to the shared pool for the downloads to reuse.
+    The response itself is ignored and failures are only logged at debug
+    level, since the downloads will surface any real network problem.
+    """
+    import urllib3
+    
+    try:
+        get_http().request(
+            "HEAD", BEATSAVER_CDN_URL + "/", retries=False, timeout=WARM_UP_TIMEOUT
+        )
+    except urllib3.exceptions.HTTPError as e:
+        logging.getLogger(__name__).debug(f"Connection warm-up failed: {e}")
+
+
+def probe_download(url: str) -> Tuple[int, int]:
+    """Check a download URL with a HEAD request before fetching it.
+    
+    Lets dead entries be detected without starting a full download, and
+    warms the shared connection pool for the GET that follows.
+    
+    Args:
+        url (str): The URL to probe.
+        
+    Returns:
+        Tuple[int, int]: A tuple containing:
+            - int: HTTP status code, or 0 if the request failed
+            - int: Advertised Content-Length, or 0 if unknown
+    """
+    import urllib3
+    
+    try:
+        response = get_http().request(
+            "HEAD", url, retries=urllib3.Retry(total=1), timeout=PROBE_TIMEOUT
+        )
+    except urllib3.exceptions.HTTPError as e:
+        logging.getLogger(__name__).debug(f"HEAD request failed for {url}: {e}")
+        return 0, 0
+    
+    try:
+        length = int(response.headers.get("Content-Length") or 0)
+    except ValueError:
+        length = 0
+    
+    return response.status, length
+
+
+def cancel_active_downloads() -> None:
+    """Make every download that is currently streaming stop early.
+    
+    Sets the cancellation flag checked between chunks and, on urllib3
+    versions that support it (2.3+), shuts down the responses being read
+    so that reads blocked on a slow connection return immediately.
+    Interrupted downloads remove their partial file and report failure.
+    """
+    _cancel_downloads.set()
+    with _active_responses_lock:
+        responses = list(_active_responses)
+    for response in responses:
+        shutdown = getattr(response, "shutdown", None)
+        if shutdown is not None:
+            try:
+                shutdown()
+            except Exception:
+                pass
+
+
+def download_missing_songs(
+    missing_songs: List[SongEntry],
+    dest_dir: Path,
+    max_workers: int = MAX_CONCURRENT_DOWNLOADS,
+    revalidate: bool = True
+) -> Tuple[int, int]:
     """Download all missing songs with progress tracking and error handling.
     
     Downloads songs from BeatSaver CDN using the song hashes, displaying
     a progress bar and handling individual song failures gracefully.
-    Failed downloads are logged and partial files are cleaned up.
+    Downloads run concurrently on a bounded thread pool since they are
+    independent and dominated by network latency. Failed downloads are
+    logged and never leave partial files behind.
+    
+    Songs are first probed with a HEAD request so songs that no longer
+    exist on the CDN are reported without starting a download. Songs whose
+    existing file is revalidated skip the probe, since their conditional
+    GET already answers 404 or 304. When the size of every remaining song
+    is known, the progress bar tracks bytes instead of songs.
     
     Args:
-        missing_songs (List[Dict]): List of song dictionaries to download.
-            Each song should contain 'hash' and 'songName' keys.
+        missing_songs (List[SongEntry]): Songs to download, as returned by
+            normalize_songs().
         dest_dir (Path): Directory where downloaded songs should be saved.
             Files are saved as {hash}.zip format.
+        max_workers (int): Maximum number of songs downloaded at the same
+            time, defaults to MAX_CONCURRENT_DOWNLOADS.
+        revalidate (bool): Whether existing files are revalidated with the
+            CDN (ETag/Last-Modified) instead of always being transferred.
         
     Returns:
         Tuple[int, int]: A tuple containing:
@@ -466,9 +900,12 @@ def download_missing_songs(missing_songs: List[Dict], dest_dir: Path) -> Tuple[i
             - int: Number of failed downloads
             
     Note:
-        Songs without valid hashes are skipped and counted as failures.
-        Progress is displayed using Rich progress bars with time estimates.
-        Partial downloads are automatically cleaned up on failure.
+        Songs without a valid 40-character hex hash or missing from the CDN
+        are skipped and counted as failures. A hash listed more than once is
+        only downloaded for its first entry. Progress is displayed using
+        Rich progress bars with time estimates. At most max_workers songs
+        are fetched at the same time. Existing files are only replaced once
+        their new download has completed.
         
     Example:
         >>> successful, failed = download_missing_songs(missing, Path("./downloads"))
@@ -477,9 +914,22 @@ def download_missing_songs(missing_songs: List[Dict], dest_dir: Path) -> Tuple[i
     if not missing_songs:
         return 0, 0
     
+    from rich.panel import Panel
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TextColumn,
+        TimeElapsedColumn,
+        TimeRemainingColumn,
+        TransferSpeedColumn,
+    )
+    
     logger = logging.getLogger(__name__)
+    console = get_console()
     successful = 0
     failed = 0
+    _cancel_downloads.clear()
     
     console.print(
         Panel.fit(
@@ -488,50 +938,141 @@ def download_missing_songs(missing_songs: List[Dict], dest_dir: Path) -> Tuple[i
         )
     )
     
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(bar_width=None),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("({task.completed}/{task.total})"),
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        
-        download_task = progress.add_task("Downloading songs", total=len(missing_songs))
-        
-        for song in missing_songs:
-            song_name = song.get("songName", "Unknown")
-            song_hash = song.get("hash", "").lower()
-            
-            if not song_hash:
-                logger.warning(f"Skipping song '{song_name}' - no hash provided")
-                failed += 1
-                progress.advance(download_task)
-                continue
-            
+    pending = []
+    seen_hashes = set()
+    for song_hash, song_name, _ in missing_songs:
+        if not song_hash:
+            logger.warning(f"Skipping song '{song_name}' - no hash provided")
+            failed += 1
+            continue
+        
+        if not _SONG_HASH_RE.fullmatch(song_hash):
+            logger.warning(f"Skipping song '{song_name}' - invalid hash '{song_hash}'")
+            failed += 1
+            continue
+        
+        # Songs listed more than once share one archive (and .part file)
+        if song_hash in seen_hashes:
+            logger.info(f"Skipping song '{song_name}' - duplicate of hash {song_hash}")
+            continue
+        seen_hashes.add(song_hash)
+        
+        download_url = f"{BEATSAVER_CDN_URL}/{song_hash}.zip"
+        pending.append((song_name, song_hash, download_url))
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    submitted: List[Future] = []
+    try:
+        # Drop songs the CDN no longer has before streaming anything. A
+        # revalidated file needs no probe: its conditional GET answers
+        # 404 or 304 on its own.
+        probes = []
+        for song_name, song_hash, download_url in pending:
             target_path = dest_dir / f"{song_hash}.zip"
-            download_url = f"{BEATSAVER_CDN_URL}/{quote_plus(song_hash)}.zip"
+            if revalidate and load_cache_validators(target_path):
+                probes.append(None)
+            else:
+                probes.append(executor.submit(probe_download, download_url))
+        submitted.extend(probe for probe in probes if probe is not None)
+        
+        downloads = []
+        probe_total = len(submitted)
+        checked = 0
+        with console.status(f"Checking songs on the CDN... (0/{probe_total})") as spinner:
+            for (song_name, song_hash, download_url), probe in zip(pending, probes):
+                if probe is None:
+                    downloads.append((song_name, song_hash, download_url, 0))
+                    continue
+                
+                status, size = probe.result()
+                checked += 1
+                spinner.update(f"Checking songs on the CDN... ({checked}/{probe_total})")
+                if status in (404, 410):  # Not found, gone
+                    logger.warning(f"HTTP {status} for {download_url}")
+                    console.print(f"  ❌ [red]Not found:[/red] {song_name}")
+                    failed += 1
+                    continue
+                downloads.append((song_name, song_hash, download_url, size))
+        
+        if not downloads:
+            return successful, failed
+        
+        track_bytes = all(size > 0 for _, _, _, size in downloads)
+        if track_bytes:
+            total = sum(size for _, _, _, size in downloads)
+            count_columns = (DownloadColumn(), TransferSpeedColumn())
+        else:
+            total = len(downloads)
+            count_columns = (TextColumn("({task.completed}/{task.total})"),)
+        
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(bar_width=None),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            *count_columns,
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
             
-            # Update progress description
-            progress.update(
-                download_task,
-                description=f"Downloading: {song_name[:30]}..."
-            )
+            download_task = progress.add_task("Downloading songs", total=total)
             
-            success = download_file_with_retry(download_url, target_path)
+            def byte_counter(received: List[int]) -> Callable[[int], None]:
+                def advance(n: int) -> None:
+                    received[0] += n
+                    progress.advance(download_task, n)
+                return advance
             
-            if success:
-                console.print(f"  ✅ [green]{song_name}[/green] -> [dim]{song_hash}.zip[/dim]")
-                successful += 1
-            else:
-                console.print(f"  ❌ [red]Failed:[/red] {song_name}")
-                failed += 1
-                # Remove partial download if it exists
-                if target_path.exists():
-                    target_path.unlink()
+            # Submit every download up front; the pool bounds concurrency
+            futures = {}
+            for song_name, song_hash, download_url, size in downloads:
+                target_path = dest_dir / f"{song_hash}.zip"
+                received = [0]
+                future = executor.submit(
+                    download_file_with_retry,
+                    download_url,
+                    target_path,
+                    progress_callback=byte_counter(received) if track_bytes else None,
+                    revalidate=revalidate,
+                )
+                futures[future] = (song_name, song_hash, size, received)
+                submitted.append(future)
             
-            progress.advance(download_task)
+            # Report results in completion order from the main thread
+            for future in as_completed(futures):
+                song_name, song_hash, size, received = futures[future]
+                
+                # Update progress description
+                progress.update(
+                    download_task,
+                    description=f"Downloaded: {song_name[:30]}..."
+                )
+                
+                if future.result():
+                    console.print(f"  ✅ [green]{song_name}[/green] -> [dim]{song_hash}.zip[/dim]")
+                    successful += 1
+                else:
+                    console.print(f"  ❌ [red]Failed:[/red] {song_name}")
+                    failed += 1
+                
+                # Account for bytes that were never streamed (failures, 304s)
+                if track_bytes:
+                    progress.advance(download_task, max(size - received[0], 0))
+                else:
+                    progress.advance(download_task)
+    except BaseException:
+        # Leaving a with-block would wait for every queued download, so
+        # Ctrl+C would only take effect once the whole playlist finished.
+        # Cancel queued work by hand (cancel_futures= needs Python 3.9)
+        # and make running downloads stop at their next chunk, since the
+        # interpreter joins the pool's threads before it can exit.
+        for future in submitted:
+            future.cancel()
+        cancel_active_downloads()
+        raise
+    finally:
+        # Never block on the pool; on success every future is already done
+        executor.shutdown(wait=False)
     
     return successful, failed
 
@@ -597,7 +1138,21 @@ def main() -> None:
     parser.add_argument(
         "--force-redownload",
         action="store_true",
-        help="Re-download files even if they already exist"
+        help="Check existing files with the server and re-download any that changed"
+    )
+    
+    parser.add_argument(
+        "--no-revalidate",
+        action="store_true",
+        help="With --force-redownload, transfer every file again even if unchanged "
+             "(e.g. to repair corrupted archives)"
+    )
+    
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=MAX_CONCURRENT_DOWNLOADS,
+        help=f"Number of songs to download in parallel (default: {MAX_CONCURRENT_DOWNLOADS})"
     )
     
     parser.add_argument(
@@ -608,9 +1163,42 @@ def main() -> None:
     
     args = parser.parse_args()
     
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    
+    if args.no_revalidate and not args.force_redownload:
+        parser.error("--no-revalidate can only be used with --force-redownload")
+    
+    try:
+        from rich.panel import Panel
+        from rich.table import Table
+    except ImportError:
+        print(
+            "This script requires the 'rich' library for enhanced UI.\n"
+            "Install it with: pip install rich",
+            file=sys.stderr
+        )
+        sys.exit(1)
+    
+    try:
+        # Keep one pooled connection per download worker
+        get_http(args.jobs)
+    except ImportError:
+        print(
+            "This script requires the 'urllib3' library for pooled HTTP connections.\n"
+            "Install it with: pip install urllib3",
+            file=sys.stderr
+        )
+        sys.exit(1)
+    
     # Setup logging
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
+    console = get_console()
+    
+    # Connect to the CDN in the background so DNS and the TLS handshake
+    # overlap with parsing the playlist and rendering the status table
+    threading.Thread(target=warm_up_connection, daemon=True).start()
     
     try:
         # Parse playlist file
@@ -623,7 +1211,7 @@ def main() -> None:
         title = playlist_data.get("playlistTitle", "Untitled Playlist")
         author = playlist_data.get("playlistAuthor", "Unknown")
         description = playlist_data.get("playlistDescription", "")
-        songs = playlist_data.get("songs", [])
+        songs = normalize_songs(playlist_data.get("songs", []))
         
         # Display playlist info
         info_table = Table(show_header=False, box=None)
@@ -665,16 +1253,22 @@ def main() -> None:
         
         # Create status table and identify missing songs
         status_table, missing_songs = create_song_status_table(songs, dest_dir)
+        
         console.print(status_table)
         
         # Handle force redownload option
         if args.force_redownload:
             missing_songs = songs
-            console.print("🔄 [yellow]Force redownload enabled - will redownload all songs[/yellow]")
+            if args.no_revalidate:
+                console.print("🔄 [yellow]Force redownload enabled - will redownload all songs[/yellow]")
+            else:
+                console.print("🔄 [yellow]Force redownload enabled - will redownload all changed songs[/yellow]")
         
         # Download missing songs
         if missing_songs:
-            successful, failed = download_missing_songs(missing_songs, dest_dir)
+            successful, failed = download_missing_songs(
+                missing_songs, dest_dir, args.jobs, revalidate=not args.no_revalidate
+            )
             
             # Final summary
             console.rule("📊 Download Summary")
@@ -7,24 +7,49 @@ It creates a virtual environment, installs dependencies, and provides usage inst
 
 Usage:
     python install.py              # Install dependencies
+    python install.py --prefetch   # Download packages to wheels/, install offline
+    python install.py --no-uv      # Install with pip even if uv is available
     python install.py --clean      # Remove virtual environment
+    python install.py --clean --keep-venv  # Uninstall package, keep environment
     python install.py --help       # Show this help
 """
 
 import argparse
+import functools
+import hashlib
 import os
-import platform
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Platform check used for console setup and virtual environment layout
+_IS_WINDOWS = sys.platform.startswith("win")
+
+# Marker written into the virtual environment after a successful install
+STAMP_FILE_NAME = ".bsaver-dl.stamp"
+
+# Local wheelhouse filled by --prefetch; installs use it instead of PyPI
+WHEELS_DIR = Path("wheels")
+
+# Files whose contents determine what gets installed
+FINGERPRINT_FILES = (
+    Path("setup/requirements.txt"),
+    Path("setup/pyproject.toml"),
+    Path("setup/setup.py"),
+)
+
+
 class Colors:
     """ANSI color codes for cross-platform colored output.
     
-    Provides ANSI escape codes for terminal colors with automatic detection
-    of color support. On Windows, attempts to enable colorama for ANSI support.
-    Falls back to empty strings when colors are not supported.
+    Provides ANSI escape codes for terminal colors. All codes start out as
+    empty strings; init_colors() detects color support once and fills them
+    in, so nothing is probed at import time or when output is not shown
+    on a terminal.
     
     Attributes:
         ENABLED (bool): Whether color output is supported on this platform.
@@ -42,34 +67,69 @@ class Colors:
         making it safe to use them unconditionally in print statements.
         
     Example:
+        >>> init_colors()
         >>> print(f"{Colors.GREEN}Success!{Colors.END}")
         >>> print(f"{Colors.RED}Error!{Colors.END}")
     """
-    if platform.system() == "Windows":
-        # Try to enable ANSI colors on Windows
-        try:
-            import colorama
-            colorama.init()
-            ENABLED = True
-        except ImportError:
-            ENABLED = False
-    else:
-        ENABLED = True
-    
-    if ENABLED:
-        RED = '\033[91m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        BLUE = '\033[94m'
-        CYAN = '\033[96m'
-        WHITE = '\033[97m'
-        BOLD = '\033[1m'
-        END = '\033[0m'
-    else:
-        RED = GREEN = YELLOW = BLUE = CYAN = WHITE = BOLD = END = ''
+    ENABLED = False
+    RED = GREEN = YELLOW = BLUE = CYAN = WHITE = BOLD = END = ''
+    _initialized = False
+
+
+def enable_windows_ansi():
+    """Turn on ANSI escape processing for the Windows console.
+    
+    Sets ENABLE_VIRTUAL_TERMINAL_PROCESSING on the stdout console handle,
+    which is supported from Windows 10 version 1511 onwards.
+    
+    Returns:
+        bool: True if the console now interprets ANSI escape codes,
+              False on older Windows versions or without a console.
+    """
+    import ctypes
+    
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+    # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+
+
+def init_colors():
+    """Detect color support and enable the Colors codes if available.
+    
+    Colors are only enabled when stdout is a terminal and the NO_COLOR
+    convention (https://no-color.org) is not in effect. On Windows the
+    console's ANSI escape processing is switched on first, and colors
+    stay disabled if that fails. Subsequent calls are no-ops.
+    
+    Returns:
+        None
+    """
+    if Colors._initialized:
+        return
+    Colors._initialized = True
+    
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        return
+    
+    if _IS_WINDOWS and not enable_windows_ansi():
+        return
+    
+    Colors.ENABLED = True
+    Colors.RED = '\033[91m'
+    Colors.GREEN = '\033[92m'
+    Colors.YELLOW = '\033[93m'
+    Colors.BLUE = '\033[94m'
+    Colors.CYAN = '\033[96m'
+    Colors.WHITE = '\033[97m'
+    Colors.BOLD = '\033[1m'
+    Colors.END = '\033[0m'
 
 
-def print_colored(message, color=Colors.WHITE):
+def print_colored(message, color=None):
     """Print a colored message to the console.
     
     Outputs text with the specified color using ANSI escape codes.
@@ -79,6 +139,7 @@ def print_colored(message, color=Colors.WHITE):
     Args:
         message (str): The message to print.
         color (str): ANSI color code from Colors class (default: Colors.WHITE).
+            Colors are only emitted after init_colors() has enabled them.
         
     Returns:
         None
@@ -87,6 +148,8 @@ def print_colored(message, color=Colors.WHITE):
         >>> print_colored("Installation complete!", Colors.GREEN)
         >>> print_colored("Warning: Check your setup", Colors.YELLOW)
     """
+    if color is None:
+        color = Colors.WHITE
     print(f"{color}{message}{Colors.END}")
 
 
@@ -106,9 +169,13 @@ def print_header():
         # 🎵 BeatSaver Playlist Downloader - Cross-Platform Installer
         # ============================================================
     """
-    print_colored("🎵 BeatSaver Playlist Downloader - Cross-Platform Installer", Colors.CYAN + Colors.BOLD)
-    print_colored("=" * 60, Colors.CYAN)
-    print()
+    C, B, E = Colors.CYAN, Colors.BOLD, Colors.END
+    sys.stdout.write(
+        f"{C}{B}🎵 BeatSaver Playlist Downloader - Cross-Platform Installer{E}\n"
+        f"{C}{'=' * 60}{E}\n"
+        f"\n"
+    )
+    sys.stdout.flush()
 
 
 def check_python_version():
@@ -140,6 +207,7 @@ def check_python_version():
     print_colored(f"✅ Python {sys.version.split()[0]} found", Colors.GREEN)
 
 
+@functools.lru_cache(maxsize=1)
 def get_venv_paths():
     """Get virtual environment paths for the current platform.
     
@@ -157,7 +225,8 @@ def get_venv_paths():
     Note:
         Paths are returned regardless of whether they actually exist.
         The virtual environment directory is always named 'venv' in
-        the current working directory.
+        the current working directory. The paths are relative and never
+        change during a run, so they are computed once and cached.
         
     Example:
         >>> venv_dir, python_exe, pip_exe, activate = get_venv_paths()
@@ -165,7 +234,7 @@ def get_venv_paths():
     """
     venv_dir = Path("venv")
     
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         python_exe = venv_dir / "Scripts" / "python.exe"
         pip_exe = venv_dir / "Scripts" / "pip.exe"
         activate_script = venv_dir / "Scripts" / "activate.bat"
@@ -180,8 +249,9 @@ def get_venv_paths():
 def create_virtual_environment():
     """Create a virtual environment for the application.
     
-    Creates a new Python virtual environment using the venv module.
-    If the virtual environment already exists, returns the existing
+    Creates a new Python virtual environment using the venv module's
+    EnvBuilder in the current interpreter.
+    If a complete virtual environment already exists, returns the existing
     paths without recreating it. Exits on creation failure.
     
     Returns:
@@ -194,7 +264,15 @@ def create_virtual_environment():
     Note:
         The virtual environment is created in a 'venv' subdirectory
         of the current working directory. Existing environments are
-        detected and reused to avoid unnecessary recreation.
+        detected and reused to avoid unnecessary recreation. An environment
+        is only considered complete once pip has been bootstrapped into it
+        (the last step of creation); anything less is left over from an
+        interrupted run and is recreated. A creation that fails or is
+        interrupted removes its partial directory.
+        
+        Building in a temporary directory and renaming it into place is
+        not an option: virtual environments embed their absolute path in
+        scripts and activation files, so a renamed one is broken.
         
     Example:
         >>> paths = create_virtual_environment()
@@ -204,30 +282,239 @@ def create_virtual_environment():
     venv_dir, python_exe, pip_exe, activate_script = get_venv_paths()
     
     if venv_dir.exists():
-        print_colored("📦 Virtual environment already exists", Colors.YELLOW)
-        return venv_dir, python_exe, pip_exe, activate_script
+        if python_exe.exists() and pip_exe.exists():
+            print_colored("📦 Virtual environment already exists", Colors.YELLOW)
+            return venv_dir, python_exe, pip_exe, activate_script
+        
+        print_colored("🧹 Removing incomplete virtual environment...", Colors.YELLOW)
+        try:
+            remove_tree(venv_dir)
+        except OSError as e:
+            print_colored(f"❌ Failed to remove virtual environment: {e}", Colors.RED)
+            sys.exit(1)
+    
+    import venv
     
     print_colored("🔧 Creating virtual environment...", Colors.BLUE)
     try:
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+        # Build the environment in this interpreter rather than starting a
+        # new one for "python -m venv"; only the pip bootstrap runs as a
+        # subprocess
+        builder = venv.EnvBuilder(with_pip=True, symlinks=not _IS_WINDOWS)
+        builder.create(str(venv_dir))
         print_colored("✅ Virtual environment created", Colors.GREEN)
-    except subprocess.CalledProcessError as e:
+    except (OSError, subprocess.CalledProcessError) as e:
         print_colored(f"❌ Failed to create virtual environment: {e}", Colors.RED)
+        if venv_dir.exists():
+            remove_tree(venv_dir)
         sys.exit(1)
+    except KeyboardInterrupt:
+        # Don't leave a half-built environment for the next run to reuse
+        if venv_dir.exists():
+            remove_tree(venv_dir)
+        raise
     
     return venv_dir, python_exe, pip_exe, activate_script
 
 
-def install_dependencies(pip_exe):
-    """Install dependencies and package using pip.
+def get_requirements_fingerprint():
+    """Compute a fingerprint of the installation inputs.
+    
+    Hashes the contents of the requirements and setup files, so a change
+    to the declared dependencies or package metadata produces a different
+    fingerprint and triggers a reinstall.
+    
+    Returns:
+        str: Hex SHA-256 digest of the fingerprinted files.
+    """
+    digest = hashlib.sha256()
+    for path in FINGERPRINT_FILES:
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_pip_cache_dir():
+    """Get the directory pip should use as its download and wheel cache.
+    
+    Honors an existing PIP_CACHE_DIR setting and otherwise uses a stable
+    per-user location, so repeated installs (for example on CI runners
+    that persist this directory) reuse downloaded and built wheels.
+    
+    Returns:
+        Path: The cache directory, created if it does not exist yet.
+    """
+    cache_dir = Path(os.environ.get("PIP_CACHE_DIR") or Path.home() / ".cache" / "bsaver-dl-pip")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_pip_environment(cache_dir):
+    """Build the environment for pip subprocesses.
+    
+    Points pip at the shared cache directory and disables its self version
+    check, which would otherwise query PyPI on every invocation.
+    
+    Args:
+        cache_dir (Path): Cache directory returned by get_pip_cache_dir().
+        
+    Returns:
+        Dict[str, str]: A copy of the current environment with pip settings.
+    """
+    env = os.environ.copy()
+    env["PIP_CACHE_DIR"] = str(cache_dir)
+    env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+    return env
+
+
+def read_requirements(requirements_file):
+    """Read the requirement specifiers from a requirements file.
+    
+    Args:
+        requirements_file (Path): Path to the requirements.txt file.
+        
+    Returns:
+        List[str]: Requirement lines, without blank lines and comments.
+    """
+    with requirements_file.open(encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def download_requirements(python_exe, requirements, dest_dir, parallel, env=None):
+    """Download requirement distributions with several pip processes at once.
+    
+    Splits the requirements into up to ``parallel`` shards and runs one
+    ``pip download`` per shard concurrently, each into its own
+    subdirectory so parallel downloads never write the same file. Fetching
+    packages is dominated by network latency, so overlapping the shards
+    shortens the overall install.
+    
+    Args:
+        python_exe (Path): Path to the Python executable in the virtual
+            environment, used to run pip.
+        requirements (List[str]): Requirement specifiers to download.
+        dest_dir (Path): Directory that receives one subdirectory per shard.
+        parallel (int): Maximum number of concurrent pip processes.
+        env (Optional[Dict[str, str]]): Environment for the pip processes.
+        
+    Returns:
+        List[Path]: Directories containing the downloaded distributions.
+        
+    Raises:
+        subprocess.CalledProcessError: If any pip download fails.
+    """
+    shard_count = max(1, min(parallel, len(requirements)))
+    shards = [requirements[i::shard_count] for i in range(shard_count)]
+    shard_dirs = [dest_dir / f"shard{i}" for i in range(shard_count)]
+    
+    def download(shard, shard_dir):
+        subprocess.run(
+            [str(python_exe), "-m", "pip", "download", "--dest", str(shard_dir), *shard],
+            check=True,
+            env=env
+        )
+    
+    with ThreadPoolExecutor(max_workers=shard_count) as executor:
+        # Consume the results so the first failure is raised here
+        list(executor.map(download, shards, shard_dirs))
+    
+    return shard_dirs
+
+
+def find_uv():
+    """Locate the uv package installer on PATH.
+    
+    uv is a drop-in replacement for pip with a parallel resolver and
+    installer, which makes (re)installing dependencies much faster.
+    
+    Returns:
+        Optional[str]: Path to the uv executable, or None if not installed.
+    """
+    return shutil.which("uv")
+
+
+def get_uv_environment():
+    """Build the environment for uv subprocesses.
     
-    Performs the complete package installation process including:
-    1. Upgrading pip to the latest version
-    2. Installing requirements from requirements.txt
-    3. Installing the package in editable mode
+    uv does not read pip's configuration, so a package index configured
+    through PIP_INDEX_URL or PIP_EXTRA_INDEX_URL (e.g. a corporate mirror)
+    is forwarded as the equivalent UV_* variable, unless that one is
+    already set.
+    
+    Returns:
+        Dict[str, str]: A copy of the current environment with uv settings.
+    """
+    env = os.environ.copy()
+    for pip_var, uv_var in (("PIP_INDEX_URL", "UV_INDEX_URL"),
+                            ("PIP_EXTRA_INDEX_URL", "UV_EXTRA_INDEX_URL")):
+        if env.get(pip_var) and not env.get(uv_var):
+            env[uv_var] = env[pip_var]
+    return env
+
+
+def prefetch_wheels(python_exe):
+    """Download all distributions needed for an offline install.
+    
+    Fetches pip, setuptools, wheel and every requirement (including
+    transitive dependencies) into the local wheelhouse directory. While
+    that directory exists, install_dependencies() installs from it with
+    no index access, so repeated installs (e.g. in CI with the directory
+    cached) skip PyPI entirely.
+    
+    Args:
+        python_exe (Path): Path to the Python executable in the virtual
+            environment, used to run pip.
+        
+    Returns:
+        None
+        
+    Raises:
+        SystemExit: Exits with code 1 if downloading fails.
+        
+    Example:
+        >>> prefetch_wheels(Path("venv/bin/python"))
+        📥 Downloading packages to wheels...
+        ✅ Packages downloaded to wheels
+    """
+    print_colored(f"📥 Downloading packages to {WHEELS_DIR}...", Colors.BLUE)
+    
+    requirements_file = Path("setup/requirements.txt").resolve()
+    pip_env = get_pip_environment(get_pip_cache_dir())
+    
+    try:
+        subprocess.run(
+            [str(python_exe.absolute()), "-m", "pip", "download",
+             "--dest", str(WHEELS_DIR.resolve()),
+             "pip", "setuptools", "wheel", "-r", str(requirements_file)],
+            check=True,
+            env=pip_env
+        )
+        print_colored(f"✅ Packages downloaded to {WHEELS_DIR}", Colors.GREEN)
+    except subprocess.CalledProcessError as e:
+        print_colored(f"❌ Failed to download packages: {e}", Colors.RED)
+        sys.exit(1)
+
+
+def install_dependencies(python_exe, parallel=1, use_uv=True):
+    """Install dependencies and package using uv or pip.
+    
+    When uv is available on PATH (and not disabled) it installs the requirements and the
+    package in editable mode in a single ``uv pip install`` run against
+    the virtual environment. Otherwise pip is used, which performs:
+    1. Upgrading pip, setuptools and wheel to the latest versions
+    2. Optionally pre-downloading requirements with parallel pip processes
+    3. Installing requirements from requirements.txt together with the
+       package in editable mode, in a single pip invocation that builds
+       the package with the environment's own setuptools
     
     Args:
-        pip_exe (Path): Path to the pip executable in the virtual environment.
+        python_exe (Path): Path to the Python executable in the virtual
+            environment, used to run pip and to point uv at it.
+        parallel (int): Number of concurrent pip downloads to use for the
+            requirements (default: 1, which downloads during the install).
+            Ignored when installing with uv or from the local wheelhouse.
+        use_uv (bool): Use uv when it is available (default: True). With
+            False, pip is always used.
         
     Returns:
         None
@@ -236,38 +523,84 @@ def install_dependencies(pip_exe):
         SystemExit: Exits with code 1 if any installation step fails.
         
     Note:
-        The function temporarily changes to the setup directory to install
-        the package, then restores the original working directory. This
-        ensures setup.py is found correctly.
+        If the wheelhouse created by prefetch_wheels() exists, uv and pip
+        install only from it and never contact the package index; a failed
+        install then suggests refreshing or deleting it. pip index settings
+        are forwarded to uv (see get_uv_environment()).
+        pip is upgraded in its own invocation so the new version is used
+        for the main install. Because setuptools is installed at the same
+        time, the package build skips pip's isolated build environment.
+        pip uses a persistent cache directory (see get_pip_cache_dir())
+        that CI systems can preserve between runs. pip is always run as
+        ``python -m pip``, which avoids the extra process spawned by the
+        pip.exe launcher on Windows. All paths are resolved up front, so
+        the working directory never needs to change.
         
     Example:
-        >>> install_dependencies(Path("venv/bin/pip"))
+        >>> install_dependencies(Path("venv/bin/python"))
         📥 Installing dependencies and package...
         ✅ Package and dependencies installed successfully
     """
     print_colored("📥 Installing dependencies and package...", Colors.BLUE)
     
+    python_exe_abs = python_exe.absolute()
+    requirements_file = Path("setup/requirements.txt").resolve()
+    package_dir = Path("setup").resolve()
+    uv_exe = find_uv() if use_uv else None
+    
+    # Restrict installs to the prefetched wheels when they are available
+    index_args = []
+    if WHEELS_DIR.is_dir():
+        print_colored(f"📦 Installing from local wheels: {WHEELS_DIR}", Colors.BLUE)
+        index_args = ["--no-index", "--find-links", str(WHEELS_DIR.resolve())]
+    
     try:
-        # Upgrade pip
-        subprocess.run([str(pip_exe), "install", "--upgrade", "pip"], check=True)
-        
-        # Install requirements
-        subprocess.run([str(pip_exe), "install", "-r", "setup/requirements.txt"], check=True)
-        
-        # Install package in editable mode (creates console scripts)
-        # Change to setup directory and install from current directory where setup.py is
-        original_cwd = os.getcwd()
-        # Resolve the pip path before changing directories
-        pip_exe_abs = pip_exe.resolve()
-        try:
-            os.chdir("setup")
-            subprocess.run([str(pip_exe_abs), "install", "-e", "."], check=True)
-        finally:
-            os.chdir(original_cwd)
+        if uv_exe:
+            # uv downloads and installs in parallel by itself and does not
+            # need an up-to-date pip in the environment
+            print_colored("⚡ Using uv to install packages", Colors.BLUE)
+            subprocess.run(
+                [uv_exe, "pip", "install", "--python", str(python_exe_abs), *index_args,
+                 "-r", str(requirements_file), "-e", str(package_dir)],
+                check=True,
+                env=get_uv_environment()
+            )
+        else:
+            cache_dir = get_pip_cache_dir()
+            pip_env = get_pip_environment(cache_dir)
+            print_colored(f"📦 Using pip cache: {cache_dir}", Colors.BLUE)
+            
+            # Upgrade pip and the build backend so the package can be built
+            # without an isolated build environment
+            subprocess.run([str(python_exe_abs), "-m", "pip", "install", *index_args,
+                            "--upgrade", "pip", "setuptools", "wheel"],
+                          check=True, env=pip_env)
+            
+            with tempfile.TemporaryDirectory(prefix="bsaver-dl-") as download_dir:
+                install_cmd = [str(python_exe_abs), "-m", "pip", "install", "--no-build-isolation", *index_args]
+                
+                # Fetch requirements concurrently, then let the install pick
+                # them up locally instead of downloading them one by one
+                if parallel > 1 and not index_args:
+                    requirements = read_requirements(requirements_file)
+                    print_colored(f"⚡ Downloading requirements with {parallel} parallel jobs...", Colors.BLUE)
+                    for shard_dir in download_requirements(python_exe_abs, requirements, Path(download_dir), parallel, pip_env):
+                        install_cmd += ["--find-links", str(shard_dir)]
+                
+                # Install requirements and the package in editable mode
+                # (creates console scripts) with one resolver run
+                install_cmd += ["-r", str(requirements_file), "-e", str(package_dir)]
+                subprocess.run(install_cmd, check=True, env=pip_env)
         
         print_colored("✅ Package and dependencies installed successfully", Colors.GREEN)
     except subprocess.CalledProcessError as e:
         print_colored(f"❌ Failed to install package: {e}", Colors.RED)
+        if index_args:
+            # The wheelhouse may be stale or incomplete after a change to
+            # the requirements
+            print_colored(f"💡 Only packages in {WHEELS_DIR}/ were used. Run "
+                          f"'python install.py --prefetch' to refresh them, or delete "
+                          f"{WHEELS_DIR}/ to install from PyPI", Colors.YELLOW)
         sys.exit(1)
 
 
@@ -279,6 +612,7 @@ def print_usage_instructions():
     - Virtual environment activation instructions
     - Platform-specific activation commands
     - Cleanup instructions
+    - A hint to install uv for faster installs, if it is not available
     
     Returns:
         None
@@ -295,37 +629,93 @@ def print_usage_instructions():
           bsaver-dl your_playlist.bplist
         ...
     """
-    print()
-    print_colored("🎉 Installation complete!", Colors.GREEN + Colors.BOLD)
-    print()
-    print_colored("You can now run the downloader with:", Colors.WHITE + Colors.BOLD)
-    print_colored("  bsaver-dl your_playlist.bplist", Colors.CYAN)
-    print()
-    print_colored("Or use Python module directly:", Colors.WHITE)
-    print_colored("  python -m bsaver_dl your_playlist.bplist", Colors.CYAN)
-    print()
-    print_colored("For help:", Colors.WHITE + Colors.BOLD)
-    print_colored("  bsaver-dl --help", Colors.CYAN)
-    print()
-    print_colored("Note:", Colors.YELLOW + Colors.BOLD)
-    print_colored("  Make sure to activate the virtual environment first:", Colors.YELLOW)
-    
-    if platform.system() == "Windows":
-        print_colored("  venv\\Scripts\\activate", Colors.CYAN)
-    else:
-        print_colored("  source venv/bin/activate", Colors.CYAN)
+    G, Y, C, W, B, E = (Colors.GREEN, Colors.YELLOW, Colors.CYAN,
+                        Colors.WHITE, Colors.BOLD, Colors.END)
+    activate = "venv\\Scripts\\activate" if _IS_WINDOWS else "source venv/bin/activate"
+    
+    # Build the whole block first and write it at once; slow consoles
+    # (notably on Windows) pay per write
+    text = (
+        f"\n"
+        f"{G}{B}🎉 Installation complete!{E}\n"
+        f"\n"
+        f"{W}{B}You can now run the downloader with:{E}\n"
+        f"{C}  bsaver-dl your_playlist.bplist{E}\n"
+        f"\n"
+        f"{W}Or use Python module directly:{E}\n"
+        f"{C}  python -m bsaver_dl your_playlist.bplist{E}\n"
+        f"\n"
+        f"{W}{B}For help:{E}\n"
+        f"{C}  bsaver-dl --help{E}\n"
+        f"\n"
+        f"{Y}{B}Note:{E}\n"
+        f"{Y}  Make sure to activate the virtual environment first:{E}\n"
+        f"{C}  {activate}{E}\n"
+        f"\n"
+        f"{W}{B}To remove the installation:{E}\n"
+        f"{C}  python install.py --clean{E}\n"
+    )
     
-    print()
-    print_colored("To remove the installation:", Colors.WHITE + Colors.BOLD)
-    print_colored("  python install.py --clean", Colors.CYAN)
+    if not find_uv():
+        text += (
+            f"\n"
+            f"{W}{B}Tip:{E}\n"
+            f"{W}  Install uv (https://docs.astral.sh/uv/) and reinstalls will use it{E}\n"
+            f"{W}  automatically for much faster dependency installation.{E}\n"
+        )
+    
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def remove_tree(root):
+    """Delete a directory tree, unlinking files in parallel.
+    
+    A virtual environment contains thousands of small files, and removing
+    them one at a time is dominated by per-file syscall latency (notably
+    on Windows and spinning disks). The tree is walked once, all files are
+    unlinked concurrently on a thread pool, and the then-empty directories
+    are removed bottom-up.
+    
+    Args:
+        root (Path): Directory to delete.
+        
+    Raises:
+        OSError: If any file or directory cannot be removed.
+    """
+    files = []
+    dirs = []
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        files.extend(os.path.join(dirpath, name) for name in filenames)
+        for name in dirnames:
+            path = os.path.join(dirpath, name)
+            # Symlinked directories (e.g. lib64 -> lib) are unlinked, not walked
+            if os.path.islink(path):
+                files.append(path)
+            else:
+                dirs.append(path)
+    
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so the first failure is raised here
+        list(executor.map(os.unlink, files))
+    
+    # os.walk(topdown=False) lists children before their parents
+    for path in dirs:
+        os.rmdir(path)
+    os.rmdir(root)
 
 
-def clean_installation():
-    """Remove the virtual environment and uninstall the package.
+def clean_installation(keep_venv=False):
+    """Remove the virtual environment or uninstall the package from it.
     
-    Performs complete cleanup of the installation including:
-    1. Uninstalling the package from the virtual environment
-    2. Removing the entire virtual environment directory
+    By default the entire virtual environment directory is removed, which
+    also removes the package. With keep_venv the virtual environment is
+    left in place and only the package is uninstalled from it.
+    
+    Args:
+        keep_venv (bool): Uninstall the package but keep the virtual
+                         environment (default: False).
     
     Returns:
         None
@@ -334,52 +724,68 @@ def clean_installation():
         SystemExit: Exits with code 1 if cleanup fails.
         
     Note:
-        Package uninstallation is attempted first but failures are ignored
-        since the entire virtual environment will be removed anyway.
-        This ensures cleanup works even if the package installation is corrupted.
+        When the virtual environment is removed, pip is not invoked at all
+        since deleting the directory already removes the package. When it
+        is kept, uninstall failures are ignored (the package might not be
+        installed) and the install stamp is removed so that the next
+        install reinstalls the package.
         
     Example:
         >>> clean_installation()
-        📤 Uninstalling package...
         🧹 Removing virtual environment...
         ✅ Virtual environment removed!
     """
-    venv_dir, _, pip_exe, _ = get_venv_paths()
+    venv_dir, python_exe, _, _ = get_venv_paths()
     
     if not venv_dir.exists():
         print_colored("📁 No virtual environment found", Colors.YELLOW)
         return
     
-    # Try to uninstall the package first
-    if pip_exe.exists():
-        try:
-            print_colored("📤 Uninstalling package...", Colors.BLUE)
-            subprocess.run([str(pip_exe), "uninstall", "bsaver-dl", "-y"], 
-                          check=True, capture_output=True)
-            print_colored("✅ Package uninstalled", Colors.GREEN)
-        except subprocess.CalledProcessError:
-            # Package might not be installed, continue with cleanup
-            pass
+    if keep_venv:
+        if python_exe.exists():
+            try:
+                print_colored("📤 Uninstalling package...", Colors.BLUE)
+                subprocess.run([str(python_exe), "-m", "pip", "uninstall", "-y", "-q", "-q", "bsaver-dl"],
+                              check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                print_colored("✅ Package uninstalled", Colors.GREEN)
+            except subprocess.CalledProcessError:
+                # Package might not be installed, continue with cleanup
+                pass
+        
+        stamp_file = venv_dir / STAMP_FILE_NAME
+        if stamp_file.exists():
+            stamp_file.unlink()
+        return
     
     print_colored("🧹 Removing virtual environment...", Colors.BLUE)
     try:
-        import shutil
-        shutil.rmtree(venv_dir)
+        remove_tree(venv_dir)
         print_colored("✅ Virtual environment removed!", Colors.GREEN)
     except Exception as e:
         print_colored(f"❌ Failed to remove virtual environment: {e}", Colors.RED)
         sys.exit(1)
 
 
-def install():
+def install(parallel=1, force=False, prefetch=False, use_uv=True):
     """Main installation function.
     
     Orchestrates the complete installation process including:
     1. Displaying the installer header
     2. Checking Python version compatibility
     3. Creating the virtual environment
-    4. Installing dependencies and the package
-    5. Displaying usage instructions
+    4. Optionally downloading all packages to the local wheelhouse
+    5. Installing dependencies and the package, unless the existing
+       installation is already up to date
+    6. Displaying usage instructions
+    
+    Args:
+        parallel (int): Number of concurrent pip downloads used when
+            installing requirements (default: 1).
+        force (bool): Reinstall dependencies even if the installation
+            looks up to date (default: False).
+        prefetch (bool): Download all packages to the local wheelhouse
+            first, so this and later installs work offline (default: False).
+        use_uv (bool): Install with uv when it is available (default: True).
     
     Returns:
         None
@@ -387,7 +793,9 @@ def install():
     Note:
         This function coordinates all installation steps and provides
         comprehensive user feedback throughout the process. Any failures
-        in individual steps will cause the program to exit.
+        in individual steps will cause the program to exit. A successful
+        install records a fingerprint of the requirements in the virtual
+        environment; later runs with the same fingerprint skip pip entirely.
         
     Example:
         >>> install()
@@ -401,20 +809,42 @@ def install():
     check_python_version()
     
     venv_dir, python_exe, pip_exe, activate_script = create_virtual_environment()
-    install_dependencies(pip_exe)
+    
+    if prefetch:
+        prefetch_wheels(python_exe)
+    
+    # Skip pip entirely when nothing changed since the last install
+    stamp_file = venv_dir / STAMP_FILE_NAME
+    fingerprint = get_requirements_fingerprint()
+    if (not force and python_exe.exists() and stamp_file.exists()
+            and stamp_file.read_text(encoding="utf-8") == fingerprint):
+        print_colored("✅ Already up to date", Colors.GREEN)
+        return
+    
+    install_dependencies(python_exe, parallel, use_uv)
+    stamp_file.write_text(fingerprint, encoding="utf-8")
     print_usage_instructions()
 
 
-def main():
+def main(argv=None):
     """Main entry point for the installation script.
     
     Parses command line arguments and routes to the appropriate function
     (install or clean). Provides comprehensive help information and
     handles both installation and cleanup workflows.
     
+    Args:
+        argv (List[str], optional): Arguments to parse instead of
+            sys.argv[1:], for callers that run the installer in-process.
+    
     Command line options:
     - No arguments: Perform installation
+    - --parallel N: Download requirements with N concurrent pip processes
+    - --force: Reinstall dependencies even if already up to date
+    - --prefetch: Download packages to wheels/ and install from there
+    - --no-uv: Install with pip even if uv is available
     - --clean: Remove virtual environment and cleanup
+    - --clean --keep-venv: Uninstall the package but keep the virtual environment
     - --help: Show help information
     
     Returns:
@@ -427,12 +857,19 @@ def main():
         $ python install.py --help    # Show help
     """
     parser = argparse.ArgumentParser(
+        prog="install.py",
         description="BeatSaver Playlist Downloader - Cross-Platform Installer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   python install.py              Install dependencies
+  python install.py --parallel 4 Install, downloading requirements in parallel
+  python install.py --force      Reinstall even if already up to date
+  python install.py --prefetch   Download packages to wheels/, then install offline
+  python install.py --no-uv      Install with pip even if uv is available
   python install.py --clean      Remove virtual environment
+  python install.py --clean --keep-venv
+                                 Uninstall the package, keep the virtual environment
   python install.py --help       Show this help
         """
     )
@@ -443,13 +880,53 @@ Examples:
         help="Remove virtual environment"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--keep-venv",
+        action="store_true",
+        help="With --clean, uninstall the package but keep the virtual environment"
+    )
+    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reinstall dependencies even if already up to date"
+    )
+    
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Download all packages to wheels/ and install from there without PyPI"
+    )
+    
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Download requirements with N concurrent pip processes (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--no-uv",
+        action="store_true",
+        help="Install with pip even if uv is available"
+    )
+    
+    args = parser.parse_args(argv)
+    
+    init_colors()
+    
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    
+    if args.keep_venv and not args.clean:
+        parser.error("--keep-venv can only be used with --clean")
     
     if args.clean:
         print_header()
-        clean_installation()
+        clean_installation(args.keep_venv)
     else:
-        install()
+        install(args.parallel, args.force, args.prefetch, not args.no_uv)
 
 
 if __name__ == "__main__":